@@ -7,16 +7,20 @@ import sys
 from pathlib import Path
 import threading
 import time
+import queue
+from concurrent.futures import ThreadPoolExecutor, Future
 from datetime import datetime
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict
 from enum import Enum
 
 # Import data models and services from media_player.py
-from media_player import Episode, PlayerState, PodcastFeedService, DownloadService, AudioPlayer
+from media_player import (
+    Episode, PlayerState, PodcastFeedService, DownloadService, DownloadCancelled, AudioPlayer, create_session
+)
 
 # Import UI components from ui.py
-from ui import Theme, Button, ProgressBar, EpisodeListView, EpisodeDetailsDialog
+from ui import Theme, Button, ProgressBar, EpisodeListView, EpisodeDetailsDialog, cached_render, format_episode_rows
 
 
 
@@ -24,7 +28,15 @@ class PodcastPlayerApp:
     """Main application controller"""
     
     def __init__(self):
-        pygame.init()
+        # Match the MP3 decoder's output so no resample step is needed, and use a
+        # 1024-sample buffer so play() starts in ~20 ms instead of ~100 ms.
+        # Smaller buffers mean more audio callbacks, which costs a little more
+        # CPU on old hardware.
+        pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=1024)
+        # Only bring up what the first frame needs; AudioPlayer starts the mixer
+        # on a background thread since device enumeration can take a few hundred ms
+        pygame.display.init()
+        pygame.font.init()
         
         # Display setup
         self.width = 1920
@@ -42,8 +54,9 @@ class PodcastPlayerApp:
         
         # Services
         self.downloads_dir = Path("downloads")
-        self.feed_service = PodcastFeedService()
-        self.download_service = DownloadService(self.downloads_dir)
+        self.http = create_session()  # Shared so feeds and downloads reuse connections
+        self.feed_service = PodcastFeedService(cache_dir=self.downloads_dir, session=self.http)
+        self.download_service = DownloadService(self.downloads_dir, session=self.http)
         self.audio_player = AudioPlayer()
         
         # UI Components
@@ -52,9 +65,28 @@ class PodcastPlayerApp:
         # State
         self.episodes: List[Episode] = []
         self.selected_episode: Optional[Episode] = None
+        self.selected_episode_index = -1  # List position of the episode in the details dialog
+        self._current_index = -1
+        self._play_position = 0.0  # Last known position of a progressively played file
+        self._resume_bytes = 0  # Download size at which buffering playback resumes
         self.last_click_time = 0
         self.double_click_threshold = 500
         
+        # Downloads run on a small bounded pool so rapid clicks can't pile up
+        self._dl_pool = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1), thread_name_prefix='dl'
+        )
+        self._current_future: Optional[Future] = None
+        self._cancel: Optional[threading.Event] = None  # Set to stop the current download
+        
+        # Prefetches get their own worker so they never queue ahead of a download
+        self._prefetch_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='prefetch')
+        
+        # Feed refreshes run off the UI thread and report back through a queue
+        self._feed_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='feed')
+        self._feed_results: queue.Queue = queue.Queue()
+        self._refreshing = False
+        
         # Initial data load
         self.refresh_episodes()
     
@@ -100,28 +132,143 @@ class PodcastPlayerApp:
         self.details_dialog = EpisodeDetailsDialog(
             (self.width, self.height), self.fonts
         )
+        
+        # Status area - "Now Playing", playback time and download progress
+        self._status_rect = pygame.Rect(0, self.height - 245, self.width, 80)
+        
+        # Static background, painted once and reused to erase dirty regions
+        self._bg_surface = pygame.Surface((self.width, self.height)).convert()
+        self._bg_surface.fill(Theme.BG)
+        title_text = self.fonts['title'].render("Podcast Player", True, Theme.TEXT)
+        self._bg_surface.blit(title_text, (50, 25))
+        
+        # Widgets that track whether they need repainting. The progress bar
+        # is left out: it's repainted as part of the status area
+        self._widgets = (
+            self.refresh_button, self.play_pause_button, self.stop_button,
+            self.episode_list, self.details_dialog
+        )
+        
+        # Status area state as last drawn; widgets track their own dirtiness
+        self._status_state: tuple = ()
+        self._full_redraw = True
+        self._needs_redraw = True
+        self._was_downloading = False
     
     def refresh_episodes(self):
-        """Refresh the episode list"""
-        self.episodes = self.feed_service.fetch_episodes()
+        """Refresh the episode list in the background"""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        future = self._feed_pool.submit(self._fetch_feed)
+        future.add_done_callback(self._on_feed_done)
+    
+    def _on_feed_done(self, future):
+        """Queue a refresh's result, or the current list if it failed, so the refresh always ends"""
+        try:
+            result = future.result()
+        except Exception as e:
+            # Includes cancellation on exit; keep showing what we have
+            print(f"Error refreshing episodes: {e}")
+            result = (self.episodes, None)
+        self._feed_results.put(result)
+    
+    def _fetch_feed(self):
+        """Fetch episodes and format their list rows; runs on the feed thread"""
+        episodes = self.feed_service.fetch_episodes()
+        if episodes is self.episodes:
+            # Feed unchanged; the list view already shows these rows
+            return episodes, None
+        return episodes, format_episode_rows(episodes)
     
-    def play_episode(self, episode: Episode):
-        """Start playing an episode"""
+    def _poll_feed_results(self):
+        """Apply any finished feed refresh on the UI thread"""
+        try:
+            episodes, rows = self._feed_results.get_nowait()
+        except queue.Empty:
+            return
+        self._refreshing = False
+        if episodes is self.episodes:
+            return
+        self.episodes = episodes
+        self.episode_list.set_episodes(episodes, rows)
+        
+        # Keep highlighting the playing episode if it's still in the feed
+        current = self.audio_player.current_episode
+        self._current_index = self._index_of(current, self._current_index) if current else -1
+        self._needs_redraw = True
+    
+    def _index_of(self, episode: Episode, hint: int = -1) -> int:
+        """List position of an episode, matched by identity and then by URL, or -1.
+        
+        `hint` is where the episode is expected to be; it is checked first so
+        the common case skips the scan.
+        """
+        if 0 <= hint < len(self.episodes) and self.episodes[hint].url == episode.url:
+            return hint
+        for i, ep in enumerate(self.episodes):
+            if ep is episode or ep.url == episode.url:
+                return i
+        return -1
+    
+    def play_episode(self, episode: Episode, episode_index: int):
+        """Start playing an episode picked at `episode_index` in the list"""
+        # The list may have been refreshed since the episode was picked
+        if not (0 <= episode_index < len(self.episodes) and self.episodes[episode_index] is episode):
+            episode_index = self._index_of(episode, episode_index)
+        self._current_index = episode_index
+        self._play_position = 0.0
+        
+        # Stop the previous episode's download and prefetch, so a late
+        # ready_cb from it can't take playback over from this one
+        self._cancel_download()
+        cancel = self._cancel = threading.Event()
+        
         def download_and_play():
-            file_path = self.download_service.download_episode(
-                episode,
-                callback=lambda p: self.download_progress.set_progress(p)
-            )
-            self.audio_player.load_and_play(file_path, episode)
+            try:
+                # No progress callback: the UI reads download_service.progress
+                # on its own frame tick, so a slow frame never stalls the download
+                self.download_service.download_episode(
+                    episode,
+                    ready_cb=lambda path: self.audio_player.load_and_play(path, episode),
+                    cancel=cancel
+                )
+            except DownloadCancelled:
+                pass
+            except Exception as e:
+                print(f"Error playing episode: {e}")
+        
+        self._current_future = self._dl_pool.submit(download_and_play)
         
-        thread = threading.Thread(target=download_and_play)
-        thread.daemon = True
-        thread.start()
+        # Warm up the start of the next episode so it plays without waiting
+        if 0 <= episode_index < len(self.episodes) - 1:
+            self._prefetch_pool.submit(
+                self.download_service.prefetch_episode, self.episodes[episode_index + 1], cancel
+            )
+    
+    def _cancel_download(self):
+        """Stop the current download, whether it's queued or already running"""
+        if self._current_future:
+            self._current_future.cancel()
+            self._current_future = None
+        if self._cancel:
+            self._cancel.set()
+            self._cancel = None
+    
+    def stop_playback(self):
+        """Stop playback and cancel any pending download"""
+        self._cancel_download()
+        self._current_index = -1
+        self.audio_player.stop()
     
     def update(self):
         """Update application state"""
+        self._poll_feed_results()
         mouse_pos = pygame.mouse.get_pos()
         
+        # Apply this frame's wheel events in one step, before hover is resolved
+        self.episode_list.flush_scroll(len(self.episodes))
+        
         # Update UI components
         self.refresh_button.update(mouse_pos)
         self.play_pause_button.update(mouse_pos)
@@ -129,85 +276,151 @@ class PodcastPlayerApp:
         self.episode_list.update(mouse_pos)
         self.details_dialog.update(mouse_pos)
         
+        self.episode_list.set_current_index(self._current_index)
+        
         # Update button text
         if self.audio_player.state == PlayerState.PLAYING:
-            self.play_pause_button.text = "Pause"
+            self.play_pause_button.set_text("Pause")
         else:
-            self.play_pause_button.text = "Play"
+            self.play_pause_button.set_text("Play")
         
         # Check if music stopped
         if self.audio_player.state == PlayerState.PLAYING:
-            if not pygame.mixer.music.get_busy():
+            if pygame.mixer.music.get_busy():
+                self._play_position = self.audio_player.get_position()
+            elif self._playing_download():
+                # Playback ran into the end of a file that is still downloading;
+                # wait for another prebuffer's worth, then pick up where it stopped
+                self.audio_player.state = PlayerState.BUFFERING
+                self._resume_bytes = self.download_service.downloaded + DownloadService.PREBUFFER_BYTES
+                self._needs_redraw = True
+            else:
                 self.audio_player.state = PlayerState.STOPPED
-    
-    def draw(self):
-        """Draw the application"""
-        self.screen.fill(Theme.BG)
-        
-        # Title - top left
-        title_text = self.fonts['title'].render("Podcast Player", True, Theme.TEXT)
-        self.screen.blit(title_text, (50, 25))
-        
-        # Buttons
-        self.refresh_button.draw(self.screen)
-        self.play_pause_button.draw(self.screen)
-        self.stop_button.draw(self.screen)
-        
-        # Episode list
-        self.episode_list.draw(self.screen, self.episodes, self.audio_player.current_episode)
+                self._needs_redraw = True
+        elif self.audio_player.state == PlayerState.BUFFERING:
+            if (not self._playing_download()
+                    or self.download_service.downloaded >= self._resume_bytes):
+                self.audio_player.resume_from(self._play_position)
+                self._needs_redraw = True
         
+        # Clear the progress bar once a download finishes
+        downloading = self.download_service.is_downloading
+        if downloading != self._was_downloading:
+            self._was_downloading = downloading
+            self._needs_redraw = True
+        if downloading:
+            self.download_progress.set_progress(round(self.download_service.progress, 1))
+    
+    def _playing_download(self) -> bool:
+        """Whether the file being played is still being downloaded"""
+        service = self.download_service
+        return service.is_downloading and service.current_file == self.audio_player.current_file
+    
+    def _status(self) -> tuple:
+        """State that determines the contents of the status area"""
+        playback_secs = 0
+        if self.audio_player.state in [PlayerState.PLAYING, PlayerState.PAUSED]:
+            playback_secs = int(self.audio_player.get_position())
+        return (self.audio_player.current_episode, playback_secs, self.download_service.is_downloading)
+    
+    def _draw_status(self, screen):
+        """Draw the now-playing, playback time and download progress area"""
+        current_episode, playback_secs, downloading = self._status_state
         # Status area - position above control buttons with more spacing
         status_y = self.height - 240  # Increased spacing above buttons and progress bar
         
         # Current episode info
-        if self.audio_player.current_episode:
-            title = self.audio_player.current_episode.title[:100]
-            if len(self.audio_player.current_episode.title) > 100:
+        if current_episode:
+            title = current_episode.title[:100]
+            if len(current_episode.title) > 100:
                 title += "..."
-            current_text = self.fonts['normal'].render(
-                f"Now Playing: {title}", True, Theme.TEXT
+            current_text = cached_render(
+                self.fonts['normal'], f"Now Playing: {title}", Theme.TEXT
             )
-            self.screen.blit(current_text, (50, status_y))
+            screen.blit(current_text, (50, status_y))
         
         # Playback time info
-        if self.audio_player.state in [PlayerState.PLAYING, PlayerState.PAUSED]:
-            pos = self.audio_player.get_position()
-            if pos > 0:
-                time_text = self.fonts['normal'].render(
-                    f"Time: {int(pos//60)}:{int(pos%60):02d}",
-                    True, Theme.TEXT
-                )
-                self.screen.blit(time_text, (50, status_y + 40))
+        if playback_secs > 0:
+            time_text = cached_render(
+                self.fonts['normal'],
+                f"Time: {playback_secs//60}:{playback_secs%60:02d}",
+                Theme.TEXT
+            )
+            screen.blit(time_text, (50, status_y + 40))
         
         # Download progress
-        if self.download_service.is_downloading:
-            self.download_progress.set_progress(self.download_service.progress)
-            self.download_progress.draw(self.screen)
-            progress_text = self.fonts['small'].render(
-                f"Downloading: {self.download_service.progress:.1f}%",
-                True, Theme.TEXT
+        if downloading:
+            self.download_progress.draw(screen)
+            progress_text = cached_render(
+                self.fonts['small'],
+                f"Downloading: {self.download_progress.progress:.1f}%",
+                Theme.TEXT
             )
             # Center the download text above the progress bar
             text_rect = progress_text.get_rect()
             text_rect.centerx = self.width // 2
             text_rect.bottom = self.download_progress.rect.top - 5
-            self.screen.blit(progress_text, text_rect)
+            screen.blit(progress_text, text_rect)
+    
+    def draw(self):
+        """Draw the application, repainting only widgets and regions that changed"""
+        dialog = self.details_dialog
+        if dialog._dirty:
+            # Opening, closing or hovering the dialog repaints the whole screen
+            self._full_redraw = True
+        elif dialog.episode:
+            # The dialog covers everything; nothing under it needs repainting
+            return
+        
+        status_state = self._status()
+        status_dirty = (status_state != self._status_state
+                        or (self.download_service.is_downloading and self.download_progress._dirty))
+        self._status_state = status_state
         
-        # Details dialog (drawn last to be on top)
-        self.details_dialog.draw(self.screen)
+        regions = [
+            (button.rect, button._dirty, button.draw)
+            for button in (self.refresh_button, self.play_pause_button, self.stop_button)
+        ]
+        regions.append((self.episode_list.rect, self.episode_list._dirty, self.episode_list.draw))
+        regions.append((self._status_rect, status_dirty, self._draw_status))
         
-        pygame.display.flip()
+        if self._full_redraw:
+            self._full_redraw = False
+            self.screen.blit(self._bg_surface, (0, 0))
+            for _, _, draw in regions:
+                draw(self.screen)
+            # Details dialog (drawn last to be on top)
+            dialog.draw(self.screen)
+            pygame.display.flip()
+        else:
+            dirty = []
+            for rect, is_dirty, draw in regions:
+                if not is_dirty:
+                    continue
+                self.screen.set_clip(rect)
+                self.screen.blit(self._bg_surface, rect, rect)
+                draw(self.screen)
+                self.screen.set_clip(None)
+                dirty.append(rect)
+            if dirty:
+                pygame.display.update(dirty)
     
     def handle_event(self, event):
         """Handle pygame events"""
         if event.type == pygame.QUIT:
             return False
         
+        elif event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+            # Window contents were lost; repaint everything
+            self._full_redraw = True
+            self._needs_redraw = True
+        
         elif event.type == pygame.KEYDOWN:
+            self._needs_redraw = True
             if event.key == pygame.K_SPACE:
                 self.audio_player.toggle_play_pause()
             elif event.key == pygame.K_s:
-                self.audio_player.stop()
+                self.stop_playback()
             elif event.key == pygame.K_ESCAPE:
                 if self.details_dialog.episode:
                     self.details_dialog.hide()
@@ -215,14 +428,15 @@ class PodcastPlayerApp:
                     return False
         
         elif event.type == pygame.MOUSEBUTTONDOWN:
+            self._needs_redraw = True
             if event.button == 1:  # Left click
                 self.handle_click(event.pos)
             elif event.button == 4:  # Scroll up
                 if not self.details_dialog.episode:
-                    self.episode_list.scroll(30, len(self.episodes))
+                    self.episode_list.scroll(30)
             elif event.button == 5:  # Scroll down
                 if not self.details_dialog.episode:
-                    self.episode_list.scroll(-30, len(self.episodes))
+                    self.episode_list.scroll(-30)
         
         return True
     
@@ -234,7 +448,7 @@ class PodcastPlayerApp:
             if action == "close":
                 self.details_dialog.hide()
             elif action == "play":
-                self.play_episode(self.details_dialog.episode)
+                self.play_episode(self.details_dialog.episode, self.selected_episode_index)
                 self.details_dialog.hide()
             return
         
@@ -244,7 +458,7 @@ class PodcastPlayerApp:
         elif self.play_pause_button.is_clicked(pos):
             self.audio_player.toggle_play_pause()
         elif self.stop_button.is_clicked(pos):
-            self.audio_player.stop()
+            self.stop_playback()
         else:
             # Check episode list
             episode_index = self.episode_list.get_clicked_episode_index(pos)
@@ -254,9 +468,10 @@ class PodcastPlayerApp:
                 if current_time - self.last_click_time < self.double_click_threshold:
                     # Double click - show details
                     self.details_dialog.show(self.episodes[episode_index])
+                    self.selected_episode_index = episode_index
                 else:
                     # Single click - play episode
-                    self.play_episode(self.episodes[episode_index])
+                    self.play_episode(self.episodes[episode_index], episode_index)
                 self.last_click_time = current_time
     
     def run(self):
@@ -269,9 +484,24 @@ class PodcastPlayerApp:
                     running = False
             
             self.update()
-            self.draw()
-            self.clock.tick(30)
+            
+            # Only draw when something changed; idle frames just sleep
+            if (self._needs_redraw or self.download_service.is_downloading
+                    or self.audio_player.state == PlayerState.PLAYING
+                    or any(widget._dirty for widget in self._widgets)):
+                self.draw()
+                self._needs_redraw = False
+                self.clock.tick(30)
+            else:
+                self.clock.tick(10)
         
+        # Pool workers aren't daemon threads and are joined at exit, so running
+        # downloads have to be told to stop rather than just abandoned
+        self._cancel_download()
+        self.download_service.shutdown()
+        self._feed_pool.shutdown(wait=False, cancel_futures=True)
+        self._dl_pool.shutdown(wait=False, cancel_futures=True)
+        self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
         pygame.quit()
 
 # ============================================================================
@@ -1,14 +1,24 @@
 import podcastparser
 import urllib.request
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pygame
 import os
 import sys
+import io
+import queue
+import json
+import hashlib
+import select
+import shutil
+import http.client
+import urllib.parse
 from pathlib import Path
 import threading
 import time
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional, List, Tuple, Dict
 from enum import Enum
 
@@ -17,7 +27,7 @@ from enum import Enum
 # Data Models
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Episode:
     """Data model for a podcast episode"""
     title: str
@@ -28,32 +38,61 @@ class Episode:
     file_size: Optional[int] = None
     index: int = 0
     
-    @property
-    def formatted_date(self) -> str:
+    # Display values derived once in __post_init__ rather than on every access
+    _formatted_date: str = field(init=False, repr=False, compare=False)
+    _formatted_duration: str = field(init=False, repr=False, compare=False)
+    _size_mb: float = field(init=False, repr=False, compare=False)
+    
+    # Episode list strings, also built once per episode
+    display_title: str = field(init=False, repr=False, compare=False)
+    display_metadata: str = field(init=False, repr=False, compare=False)
+    display_description_preview: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self._formatted_date = "Unknown date"
         if self.published:
             try:
                 dt = datetime.fromtimestamp(self.published)
-                return dt.strftime("%b %d, %Y")
+                self._formatted_date = dt.strftime("%b %d, %Y")
             except:
                 pass
-        return "Unknown date"
+        
+        self._formatted_duration = ""
+        if self.duration:
+            hours = int(self.duration // 3600)
+            minutes = int((self.duration % 3600) // 60)
+            secs = int(self.duration % 60)
+            if hours > 0:
+                self._formatted_duration = f"{hours}:{minutes:02d}:{secs:02d}"
+            else:
+                self._formatted_duration = f"{minutes}:{secs:02d}"
+        
+        self._size_mb = self.file_size / (1024 * 1024) if self.file_size else 0
+        
+        title = self.title
+        self.display_title = title[:87] + '...' if len(title) > 90 else title
+        
+        metadata_parts = [self._formatted_date]
+        if self._formatted_duration:
+            metadata_parts.append(f"Duration: {self._formatted_duration}")
+        if self._size_mb:
+            metadata_parts.append(f"Size: {self._size_mb:.1f} MB")
+        self.display_metadata = " | ".join(metadata_parts)
+        
+        desc = self.description
+        self.display_description_preview = desc[:120] + '...' if len(desc) > 120 else desc
+    
+    @property
+    def formatted_date(self) -> str:
+        return self._formatted_date
     
     @property
     def formatted_duration(self) -> str:
-        if not self.duration:
-            return ""
-        hours = int(self.duration // 3600)
-        minutes = int((self.duration % 3600) // 60)
-        secs = int(self.duration % 60)
-        if hours > 0:
-            return f"{hours}:{minutes:02d}:{secs:02d}"
-        return f"{minutes}:{secs:02d}"
+        return self._formatted_duration
     
     @property
     def size_mb(self) -> float:
-        if self.file_size:
-            return self.file_size / (1024 * 1024)
-        return 0
+        return self._size_mb
 
 class PlayerState(Enum):
     """Player state enumeration"""
@@ -61,98 +100,587 @@ class PlayerState(Enum):
     PLAYING = "playing"
     PAUSED = "paused"
     DOWNLOADING = "downloading"
+    BUFFERING = "buffering"  # Playback caught up with the download and is waiting
 
 # ============================================================================
 # Services
 # ============================================================================
 
+# (connect, read) timeouts in seconds: fail fast on unreachable hosts while
+# tolerating slow CDNs mid-transfer
+HTTP_TIMEOUT = (5, 30)
+
+def create_session(pool_connections: int = 16, pool_maxsize: int = 32) -> requests.Session:
+    """Create a pooled keep-alive HTTP session that retries transient gateway errors"""
+    session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retries
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
 class PodcastFeedService:
     """Handles fetching and parsing podcast feeds"""
     
-    def __init__(self, feed_url: str = 'https://realpython.com/podcasts/rpp/feed'):
+    def __init__(self, feed_url: str = 'https://realpython.com/podcasts/rpp/feed',
+                 cache_dir: Path = Path("downloads"),
+                 session: Optional[requests.Session] = None):
         self.feed_url = feed_url
         self.podcast_title = "Podcast"
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(exist_ok=True)
+        self._cache_file = self.cache_dir / "feed_cache.json"
+        self._parse_cache_file = self.cache_dir / "parse_cache.json"
+        self._cache: Dict[str, Dict] = {}
+        self._parse_cache: Dict[str, Dict] = {}
+        self._load_cache()
+        
+        # Episodes built from the last parse, reused while the feed is unchanged
+        self._episodes_key: Optional[Tuple[str, int]] = None
+        self._cached_episodes: List[Episode] = []
+        
+        # Pooled keep-alive session so refreshes skip the TCP+TLS handshake
+        self.session = session or create_session(pool_connections=8, pool_maxsize=16)
     
     def fetch_episodes(self, limit: int = 20) -> List[Episode]:
         """Fetch episodes from podcast feed"""
         try:
-            parsed = podcastparser.parse(self.feed_url, urllib.request.urlopen(self.feed_url))
+            body_hash, parsed = self._fetch_parsed(self.feed_url, limit)
             self.podcast_title = parsed.get('title', 'Podcast')
             
-            episodes = []
-            for i, ep in enumerate(parsed['episodes'][:limit]):
-                if ep.get('enclosures'):
-                    episode = Episode(
-                        title=ep.get('title', 'Unknown'),
-                        description=ep.get('description', ''),
-                        url=ep['enclosures'][0]['url'],
-                        published=ep.get('published'),
-                        duration=ep.get('total_time'),
-                        file_size=ep['enclosures'][0].get('file_size'),
-                        index=i
-                    )
-                    episodes.append(episode)
+            # Unchanged feed: hand back the same Episode objects
+            if self._episodes_key == (body_hash, limit):
+                return self._cached_episodes
+            
+            episodes = [
+                Episode(
+                    title=ep.get('title', 'Unknown'),
+                    description=ep.get('description', ''),
+                    url=enclosure['url'],
+                    published=ep.get('published'),
+                    duration=ep.get('total_time'),
+                    file_size=enclosure.get('file_size'),
+                    index=i
+                )
+                for i, ep in enumerate(parsed['episodes'][:limit])
+                if (enclosures := ep.get('enclosures')) and (enclosure := enclosures[0])
+            ]
+            self._episodes_key = (body_hash, limit)
+            self._cached_episodes = episodes
             return episodes
         except Exception as e:
             print(f"Error fetching feed: {e}")
-            return []
+            # Keep the episodes from the last good fetch rather than blanking the list
+            return self._cached_episodes
+    
+    def _fetch_parsed(self, url: str, limit: int = 0) -> Tuple[str, Dict]:
+        """Fetch and parse a feed, skipping the parse when the body is unchanged.
+        
+        Only the newest `limit` episodes are kept (0 keeps all). Returns the
+        body's content hash along with the parsed feed.
+        """
+        entry = self._cache.get(url, {})
+        # RSS is highly compressible; ask for gzip explicitly
+        headers = {'Accept-Encoding': 'gzip'}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        
+        response = self.session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT)
+        if response.status_code == 304:
+            parsed = self._cached_parse(entry.get('body_hash'), limit)
+            if parsed is not None:
+                response.close()
+                return entry['body_hash'], parsed
+            # Cached parse is gone, so ask for the full body again
+            response.close()
+            response = self.session.get(
+                url, headers={'Accept-Encoding': 'gzip'}, stream=True, timeout=HTTP_TIMEOUT
+            )
+        response.raise_for_status()
+        
+        # The body is hashed before parsing, so it is read off the raw stream
+        # in one go rather than handed to podcastparser as a file object
+        response.raw.decode_content = True
+        body = response.raw.read()
+        body_hash = hashlib.blake2b(body, digest_size=16).hexdigest()
+        new_entry = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'body_hash': body_hash,
+        }
+        parsed = self._cached_parse(body_hash, limit)
+        if parsed is not None and new_entry == entry:
+            return body_hash, parsed
+        if parsed is None:
+            # podcastparser has to see every item to order them, but truncating
+            # here keeps the cached parse, and its file, down to what's shown
+            parsed = podcastparser.parse(url, io.BytesIO(body), max_episodes=limit)
+            self._parse_cache[body_hash] = {'limit': limit, 'feed': parsed}
+        
+        self._cache[url] = new_entry
+        # Only keep parses that some feed still points at
+        live = {e.get('body_hash') for e in self._cache.values()}
+        self._parse_cache = {h: p for h, p in self._parse_cache.items() if h in live}
+        self._save_cache()
+        return body_hash, parsed
+    
+    def _cached_parse(self, body_hash: Optional[str], limit: int) -> Optional[Dict]:
+        """Return the cached parse of a body if it holds at least `limit` episodes"""
+        cached = self._parse_cache.get(body_hash)
+        if cached is None or 'feed' not in cached:
+            return None
+        # The limit the body was parsed with; 0 means every episode was kept
+        kept = cached.get('limit', 0)
+        if kept and (not limit or kept < limit):
+            return None
+        return cached['feed']
+    
+    def _load_cache(self):
+        """Load the feed validators and parsed-feed cache from disk"""
+        self._cache = self._read_json(self._cache_file)
+        self._parse_cache = self._read_json(self._parse_cache_file)
+    
+    @staticmethod
+    def _read_json(path: Path) -> Dict[str, Dict]:
+        """Read a cache file mapping keys to JSON objects.
+        
+        A missing or damaged file reads as empty, and entries of the wrong
+        shape are dropped, so a stale cache only costs a refetch.
+        """
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict):
+            return {}
+        return {k: v for k, v in data.items() if isinstance(v, dict)}
+    
+    def _save_cache(self):
+        """Persist the feed validators and parsed-feed cache"""
+        try:
+            self._parse_cache_file.write_text(json.dumps(self._parse_cache))
+            self._cache_file.write_text(json.dumps(self._cache))
+        except OSError as e:
+            print(f"Error writing feed cache: {e}")
+
+class DownloadCancelled(Exception):
+    """Raised when a download's cancel event is set before it finishes"""
+
+class _CancellableReader:
+    """Response body wrapper whose read() stops a copy once the download is cancelled"""
+    
+    def __init__(self, raw, check_cancel):
+        self._raw = raw
+        self._check_cancel = check_cancel
+    
+    def read(self, size: int = -1) -> bytes:
+        self._check_cancel()
+        # read1 returns whatever has arrived instead of blocking for a full chunk
+        return self._raw.read1(size)
 
 class DownloadService:
     """Handles downloading podcast episodes"""
     
-    def __init__(self, downloads_dir: Path):
+    CHUNK_SIZE = 1 << 20  # 1 MiB per read keeps the copy loop off the interpreter
+    PROGRESS_INTERVAL = 0.25  # Seconds between progress updates
+    READ_SIZE = 64 << 10  # Smaller reads for files the player is already reading
+    PREBUFFER_BYTES = 512 << 10  # Start of file fetched before playback can begin
+    PREFETCH_BYTES = 1 << 20  # Start of the next episode fetched ahead of time
+    
+    # Read buffers shared by the download and the prefetch; most recently
+    # returned first so the same few stay warm, and there are never more
+    # than concurrent readers
+    _BUF_POOL: "queue.LifoQueue[bytearray]" = queue.LifoQueue()
+    
+    def __init__(self, downloads_dir: Path, session: Optional[requests.Session] = None):
         self.downloads_dir = downloads_dir
         self.downloads_dir.mkdir(exist_ok=True)
-        self.progress = 0
         self.is_downloading = False
+        self.current_file: Optional[Path] = None  # File being downloaded, if any
+        
+        # Progress counters: only the download thread writes them, so they
+        # are updated without a lock and summed on read
+        self._total_bytes = 0
+        self._part_bytes: List[int] = []
         self._lock = threading.Lock()
+        self._owner: Optional[object] = None  # Download the shared state belongs to
+        self._prefetched: Dict[Path, Tuple[str, int]] = {}  # filename -> (url, bytes)
+        
+        # One pooled session so the probe, prefetch and download reuse a warm connection
+        self.session = session or create_session(pool_connections=4, pool_maxsize=4)
+        self._closed = threading.Event()  # Set by shutdown(); stops every download
     
-    def download_episode(self, episode: Episode, callback=None) -> Path:
-        """Download episode to local file"""
+    def download_episode(self, episode: Episode, callback=None, ready_cb=None,
+                         cancel: Optional[threading.Event] = None) -> Path:
+        """Download episode to local file.
+        
+        ready_cb(path) is called once the file can start playing: as soon as
+        the first PREBUFFER_BYTES are on disk when the server supports ranges,
+        otherwise when the download completes. An episode that was already
+        downloaded in full is played straight from disk.
+        
+        Setting cancel stops the download between reads with DownloadCancelled,
+        and ready_cb is never called after that.
+        """
+        self._check_cancel(cancel)
+        filename = self.downloads_dir / f"episode_{episode.index}.mp3"
+        if self._is_complete(episode, filename):
+            if ready_cb:
+                ready_cb(filename)
+            return filename
+        
+        # A cancelled download may still be unwinding when the next one starts,
+        # so only the newest download resets the shared state
+        owner = object()
         with self._lock:
+            self._owner = owner
             self.is_downloading = True
-            self.progress = 0
+            self.current_file = filename
+            self._total_bytes = 0
+            self._part_bytes = []
         
+        try:
+            # The file stops counting as complete as soon as it's rewritten
+            self._source_file(filename).unlink(missing_ok=True)
+            url, total_size = self._probe_range(episode.url)
+            if total_size:
+                self._download_progressive(url, total_size, filename, callback, ready_cb, cancel)
+            else:
+                if not self._download_splice(episode.url, filename, callback, cancel):
+                    self._download_stream(episode.url, filename, callback, cancel)
+                self._check_cancel(cancel)
+                if ready_cb:
+                    ready_cb(filename)
+            # Record the size actually received; the feed's enclosure length is often wrong
+            source = {'url': episode.url, 'size': filename.stat().st_size}
+            self._source_file(filename).write_text(json.dumps(source))
+            return filename
+        finally:
+            with self._lock:
+                if self._owner is owner:
+                    self._owner = None
+                    self.is_downloading = False
+                    self.current_file = None
+                    self._total_bytes = 0
+                    self._part_bytes = []
+    
+    @property
+    def downloaded(self) -> int:
+        """Bytes of the current download on disk so far"""
+        return sum(self._part_bytes)
+    
+    @property
+    def progress(self) -> float:
+        """Progress of the current download (0-100)"""
+        total = self._total_bytes
+        return (self.downloaded / total * 100) if total else 0
+    
+    def prefetch_episode(self, episode: Episode, cancel: Optional[threading.Event] = None):
+        """Fetch the start of an episode ahead of time so playing it starts instantly"""
         filename = self.downloads_dir / f"episode_{episode.index}.mp3"
+        if self._is_complete(episode, filename):
+            return
+        try:
+            url, total_size = self._probe_range(episode.url)
+            if not total_size:
+                return
+            size = min(self.PREFETCH_BYTES, total_size)
+            headers = {'Range': f'bytes=0-{size - 1}'}
+            with self.session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+                if response.status_code != 206:
+                    return
+                # Write in place without truncating, in case a download is already filling it
+                self._source_file(filename).unlink(missing_ok=True)
+                fd = os.open(filename, os.O_WRONLY | os.O_CREAT, 0o644)
+                received = 0
+                try:
+                    for received in self._write_body(response, fd, 0, cancel):
+                        pass
+                finally:
+                    os.close(fd)
+            with self._lock:
+                self._prefetched[filename] = (url, received)
+        except DownloadCancelled:
+            pass
+        except (requests.RequestException, OSError) as e:
+            print(f"Error prefetching episode: {e}")
+    
+    def shutdown(self):
+        """Stop all downloads.
+        
+        Downloads run on pool threads that are joined at interpreter exit, so
+        in-flight reads are stopped between chunks instead of being left to finish.
+        """
+        self._closed.set()
+    
+    def _check_cancel(self, cancel: Optional[threading.Event]):
+        """Stop the calling download if it was cancelled or the service shut down"""
+        if self._closed.is_set() or (cancel is not None and cancel.is_set()):
+            raise DownloadCancelled()
+    
+    @staticmethod
+    def _source_file(filename: Path) -> Path:
+        """Sidecar holding the URL and size of a fully downloaded episode file"""
+        return filename.with_name(filename.name + '.url')
+    
+    def _is_complete(self, episode: Episode, filename: Path) -> bool:
+        """Check whether this episode was fully downloaded to filename earlier.
         
+        Files are named by feed position, which shifts when an episode is
+        published, so the file must have come from this episode's URL. The
+        sidecar recording that URL is only written once every byte is in,
+        along with the size the file had then.
+        """
         try:
-            response = requests.get(episode.url, stream=True)
+            source = json.loads(self._source_file(filename).read_text())
+            size = filename.stat().st_size
+        except (OSError, ValueError):
+            return False
+        if not isinstance(source, dict) or source.get('url') != episode.url:
+            return False
+        return size == source.get('size')
+    
+    def _take_buffer(self) -> bytearray:
+        """Check a read buffer out of the pool, allocating one if none are free"""
+        try:
+            return self._BUF_POOL.get_nowait()
+        except queue.Empty:
+            return bytearray(self.READ_SIZE)
+    
+    def _probe_range(self, url: str) -> Tuple[str, int]:
+        """Return the final URL and its size, or a size of 0 if ranges are unsupported"""
+        try:
+            response = self.session.head(url, allow_redirects=True, timeout=HTTP_TIMEOUT)
             response.raise_for_status()
+        except requests.RequestException:
+            return url, 0
+        
+        if response.headers.get('accept-ranges', '').lower() != 'bytes':
+            return url, 0
+        return response.url, int(response.headers.get('content-length', 0))
+    
+    def _download_progressive(self, url: str, total_size: int, filename: Path, callback=None,
+                              ready_cb=None, cancel: Optional[threading.Event] = None):
+        """Download a file front to back, starting playback once its head is on disk.
+        
+        The player reads the file while it grows, so bytes have to land in
+        order: a single continuation request appends to any prefetched head,
+        and the file is never preallocated, so there are no zero-filled holes
+        for the decoder to run into.
+        """
+        with self._lock:
+            prefetched_url, prefetched = self._prefetched.pop(filename, (None, 0))
+        start = prefetched if prefetched_url == url else 0
+        head_size = min(self.PREBUFFER_BYTES, total_size)
+        
+        self._part_bytes = part_bytes = [start]
+        self._total_bytes = total_size
+        last_update = time.monotonic()
+        
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT, 0o644)
+        try:
+            # Keep the prefetched head; anything after it may be left over
+            # from an earlier, unfinished download
+            os.ftruncate(fd, start)
+            ready = start >= head_size
+            if ready and ready_cb:
+                self._check_cancel(cancel)
+                ready_cb(filename)
+            if start < total_size:
+                headers = {'Range': f'bytes={start}-'}
+                with self.session.get(url, headers=headers, stream=True, timeout=HTTP_TIMEOUT) as response:
+                    for offset in self._write_body(response, fd, start, cancel):
+                        part_bytes[0] = offset
+                        if not ready and offset >= head_size:
+                            ready = True
+                            if ready_cb:
+                                ready_cb(filename)
+                        
+                        now = time.monotonic()
+                        if callback and now - last_update >= self.PROGRESS_INTERVAL:
+                            last_update = now
+                            callback(self.progress)
+                if part_bytes[0] < total_size:
+                    raise requests.ConnectionError(
+                        f"Connection closed after {part_bytes[0]} of {total_size} bytes")
+            if not ready and ready_cb:
+                self._check_cancel(cancel)
+                ready_cb(filename)
+        finally:
+            os.close(fd)
+    
+    def _write_body(self, response: requests.Response, fd: int, offset: int,
+                    cancel: Optional[threading.Event] = None):
+        """Write a ranged response into place as it arrives, yielding the offset reached"""
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise requests.HTTPError(f"Server ignored range request for {response.url}")
+        
+        response.raw.decode_content = True
+        body = response.raw._fp
+        if isinstance(body, http.client.HTTPResponse) and \
+                response.headers.get('content-encoding', 'identity') == 'identity':
+            # urllib3's readinto() is read() plus a copy, so plain bodies are
+            # read by http.client straight into a pooled buffer. It returns
+            # 0 rather than raising if the connection drops, so callers have
+            # to check the offset they end up at
+            buffer = self._take_buffer()
+            try:
+                with memoryview(buffer) as view:
+                    while n := body.readinto(view):
+                        self._check_cancel(cancel)
+                        # Positional writes don't share a file offset, so no lock
+                        os.pwrite(fd, view[:n], offset)
+                        offset += n
+                        yield offset
+            finally:
+                self._BUF_POOL.put(buffer)
+        else:
+            # Compressed bodies have to go through urllib3's decoder
+            while data := response.raw.read1(self.READ_SIZE):
+                self._check_cancel(cancel)
+                os.pwrite(fd, data, offset)
+                offset += len(data)
+                yield offset
+    
+    def _download_splice(self, url: str, filename: Path, callback=None,
+                         cancel: Optional[threading.Event] = None) -> bool:
+        """Download a plain-HTTP body socket-to-file inside the kernel.
+        
+        Returns False without writing anything when the zero-copy path doesn't
+        apply (TLS, redirects, encoded or chunked bodies, no os.splice).
+        """
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != 'http' or not hasattr(os, 'splice'):
+            return False
+        
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        conn = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        try:
+            conn.request('GET', path, headers={'Accept-Encoding': 'identity'})
+            response = conn.getresponse()
+            total_size = int(response.getheader('Content-Length') or 0)
+            if (response.status != 200 or not total_size
+                    or response.getheader('Content-Encoding')
+                    or response.getheader('Transfer-Encoding')):
+                return False
             
+            with open(filename, 'wb', buffering=0) as f:
+                # Body bytes already pulled into http.client's buffer go first
+                buffered = response.fp.peek()[:total_size]
+                f.write(buffered)
+                response.fp.read(len(buffered))
+                downloaded = len(buffered)
+                self._part_bytes = part_bytes = [downloaded]
+                self._total_bytes = total_size
+                
+                sock_fd = conn.sock.fileno()
+                pipe_r, pipe_w = os.pipe()
+                last_update = time.monotonic()
+                try:
+                    while downloaded < total_size:
+                        self._check_cancel(cancel)
+                        try:
+                            n = os.splice(sock_fd, pipe_w, min(self.CHUNK_SIZE, total_size - downloaded))
+                        except BlockingIOError:
+                            if not select.select([sock_fd], [], [], 30)[0]:
+                                raise TimeoutError(f"Timed out downloading {url}")
+                            continue
+                        if n == 0:
+                            raise ConnectionError(f"Connection closed early downloading {url}")
+                        pending = n
+                        while pending:
+                            pending -= os.splice(pipe_r, f.fileno(), pending)
+                        downloaded += n
+                        part_bytes[0] = downloaded
+                        
+                        now = time.monotonic()
+                        if callback and now - last_update >= self.PROGRESS_INTERVAL:
+                            last_update = now
+                            callback(self.progress)
+                finally:
+                    os.close(pipe_r)
+                    os.close(pipe_w)
+            return True
+        finally:
+            conn.close()
+    
+    def _download_stream(self, url: str, filename: Path, callback=None,
+                         cancel: Optional[threading.Event] = None):
+        """Download a file sequentially over a single connection"""
+        with self.session.get(url, stream=True, timeout=HTTP_TIMEOUT) as response:
+            response.raise_for_status()
+            # Chunked transfers have no size, so progress stays at 0
             total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
             
-            with open(filename, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if total_size:
-                        with self._lock:
-                            self.progress = (downloaded / total_size) * 100
+            # Chunks are already large, so skip Python's extra buffering layer
+            with open(filename, 'wb', buffering=0) as f:
+                # copyfileobj keeps the per-chunk work to a read and a write;
+                # progress is sampled from the file size on a side thread
+                done = threading.Event()
+                self._part_bytes = part_bytes = [0]
+                self._total_bytes = total_size
+                
+                def sample_progress():
+                    while not done.wait(self.PROGRESS_INTERVAL):
+                        part_bytes[0] = os.fstat(f.fileno()).st_size
                         if callback:
                             callback(self.progress)
-            
-            return filename
-        finally:
-            with self._lock:
-                self.is_downloading = False
-                self.progress = 0
+                
+                sampler = threading.Thread(target=sample_progress, daemon=True)
+                sampler.start()
+                try:
+                    response.raw.decode_content = True
+                    # The wrapper checks for cancellation before every read
+                    reader = _CancellableReader(response.raw, lambda: self._check_cancel(cancel))
+                    shutil.copyfileobj(reader, f, self.CHUNK_SIZE)
+                finally:
+                    done.set()
+                    sampler.join()
 
 class AudioPlayer:
     """Handles audio playback"""
     
     def __init__(self):
-        pygame.mixer.init()
         self.state = PlayerState.STOPPED
         self.current_episode: Optional[Episode] = None
         self.current_file: Optional[Path] = None
+        self._start_offset = 0.0  # Seconds into the file where play() last started
+        
+        # Opening the audio device is slow, so do it off the UI thread
+        self._init_evt = threading.Event()
+        threading.Thread(target=self._init_mixer, daemon=True).start()
+    
+    def _init_mixer(self):
+        """Open the audio device and signal anyone waiting to play"""
+        try:
+            pygame.mixer.init()
+        finally:
+            self._init_evt.set()
     
     def load_and_play(self, file_path: Path, episode: Episode):
         """Load and play an audio file"""
+        self._init_evt.wait()
         pygame.mixer.music.load(str(file_path))
         pygame.mixer.music.play()
         self.current_file = file_path
         self.current_episode = episode
+        self._start_offset = 0.0
+        self.state = PlayerState.PLAYING
+    
+    def resume_from(self, seconds: float):
+        """Reopen the current file and continue playing from a position"""
+        if not self.current_file:
+            return
+        pygame.mixer.music.load(str(self.current_file))
+        pygame.mixer.music.play(start=seconds)
+        self._start_offset = seconds
         self.state = PlayerState.PLAYING
     
     def toggle_play_pause(self):
@@ -166,7 +694,8 @@ class AudioPlayer:
     
     def stop(self):
         """Stop playback"""
-        pygame.mixer.music.stop()
+        if self._init_evt.is_set():
+            pygame.mixer.music.stop()
         self.state = PlayerState.STOPPED
         self.current_episode = None
         self.current_file = None
@@ -174,7 +703,7 @@ class AudioPlayer:
     def get_position(self) -> float:
         """Get current playback position in seconds"""
         if self.state in [PlayerState.PLAYING, PlayerState.PAUSED]:
-            return pygame.mixer.music.get_pos() / 1000
+            return self._start_offset + pygame.mixer.music.get_pos() / 1000
         return 0
     
     def is_playing(self) -> bool:
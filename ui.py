@@ -12,10 +12,81 @@ from datetime import datetime
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict
 from enum import Enum
+from collections import OrderedDict
+import functools
 
 
 from media_player import Episode
 
+# Rendered text surfaces keyed by (font, text, color), least recently used first.
+# Keys hold the font itself rather than id(font) so an id can't be reused by
+# a different font while its surfaces are still cached.
+_TEXT_CACHE_SIZE = 512
+_text_cache: "OrderedDict[tuple, pygame.Surface]" = OrderedDict()
+
+def cached_render(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface from an earlier identical call"""
+    key = (font, text, color)
+    surface = _text_cache.get(key)
+    if surface is None:
+        surface = font.render(text, True, color).convert_alpha()
+        _text_cache[key] = surface
+        if len(_text_cache) > _TEXT_CACHE_SIZE:
+            _text_cache.popitem(last=False)
+    else:
+        _text_cache.move_to_end(key)
+    return surface
+
+# Pixel widths of individual words keyed by (font, word)
+_WORD_WIDTH_CACHE_SIZE = 4096
+_word_widths: Dict[tuple, int] = {}
+
+def word_width(font: pygame.font.Font, word: str) -> int:
+    """Measure a single word, reusing earlier measurements"""
+    key = (font, word)
+    width = _word_widths.get(key)
+    if width is None:
+        if len(_word_widths) >= _WORD_WIDTH_CACHE_SIZE:
+            _word_widths.clear()
+        width = _word_widths[key] = font.size(word)[0]
+    return width
+
+@functools.lru_cache(maxsize=64)
+def wrap_text(text: str, font: pygame.font.Font, max_width: int) -> Tuple[str, ...]:
+    """Split text into lines that fit within max_width, remembering recent layouts"""
+    space_w = word_width(font, " ")
+    lines = []
+    current_words = []
+    current_w = 0
+    
+    # Track the line width by addition instead of re-measuring the whole line
+    for word in text.split():
+        word_w = word_width(font, word)
+        test_w = current_w + space_w + word_w if current_words else word_w
+        if test_w < max_width:
+            current_words.append(word)
+            current_w = test_w
+        else:
+            if current_words:
+                lines.append(" ".join(current_words))
+            current_words = [word]
+            current_w = word_w
+    if current_words:
+        lines.append(" ".join(current_words))
+    return tuple(lines)
+
+def format_episode_rows(episodes: List[Episode]) -> Tuple[List[str], List[str], List[str]]:
+    """Build the list view's title, metadata and description strings for each episode.
+    
+    Only the position prefix is added here; the rest is precomputed on each
+    Episode. Pure string work with no pygame calls, so it can run on the feed thread.
+    """
+    titles = [f"{i+1}. {episode.display_title}" for i, episode in enumerate(episodes)]
+    metadata = [episode.display_metadata for episode in episodes]
+    descriptions = [episode.display_description_preview for episode in episodes]
+    
+    return titles, metadata, descriptions
+
 class Theme:
     """UI Theme configuration"""
     BG = (30, 30, 40)
@@ -36,18 +107,29 @@ class Button:
         self.text = text
         self.font = font
         self.is_hovered = False
+        self._dirty = True  # Needs repainting
     
     def update(self, mouse_pos: Tuple[int, int]):
         """Update button state"""
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+        is_hovered = self.rect.collidepoint(mouse_pos)
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self._dirty = True
+    
+    def set_text(self, text: str):
+        """Change the button label"""
+        if text != self.text:
+            self.text = text
+            self._dirty = True
     
     def draw(self, screen: pygame.Surface):
         """Draw the button"""
+        self._dirty = False
         color = Theme.BUTTON_HOVER if self.is_hovered else Theme.BUTTON
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, Theme.TEXT, self.rect, 2)
         
-        text_surf = self.font.render(self.text, True, Theme.TEXT)
+        text_surf = cached_render(self.font, self.text, Theme.TEXT)
         text_rect = text_surf.get_rect(center=self.rect.center)
         screen.blit(text_surf, text_rect)
     
@@ -61,13 +143,18 @@ class ProgressBar:
     def __init__(self, rect: pygame.Rect):
         self.rect = rect
         self.progress = 0
+        self._dirty = True  # Needs repainting
     
     def set_progress(self, progress: float):
         """Set progress (0-100)"""
-        self.progress = max(0, min(100, progress))
+        progress = max(0, min(100, progress))
+        if progress != self.progress:
+            self.progress = progress
+            self._dirty = True
     
     def draw(self, screen: pygame.Surface):
         """Draw the progress bar"""
+        self._dirty = False
         pygame.draw.rect(screen, Theme.PROGRESS_BG, self.rect)
         if self.progress > 0:
             fill_width = int(self.rect.width * (self.progress / 100))
@@ -83,92 +170,118 @@ class EpisodeListView:
         self.small_font = small_font
         self.scroll_offset = 0
         self.episode_height = 75  # Increased height for better spacing
-        self.episode_rects: List[pygame.Rect] = []
+        self._stride = self.episode_height + 10  # Row height plus the gap below it
+        self._pending_delta = 0  # Wheel movement not yet applied this frame
         self.hovered_index = -1
+        self.current_index = -1
+        self._dirty = True  # Needs repainting
+        
+        # Per-row display strings, built once per episode list (see set_episodes)
+        self.episodes: List[Episode] = []
+        self.titles: List[str] = []
+        self.metadata: List[str] = []
+        self.descriptions: List[str] = []
+        self._list_surface: Optional[pygame.Surface] = None
+    
+    def set_episodes(self, episodes: List[Episode], rows: Optional[Tuple[List[str], List[str], List[str]]] = None):
+        """Install a new episode list; rows are precomputed format_episode_rows output"""
+        self.episodes = episodes
+        self.titles, self.metadata, self.descriptions = rows or format_episode_rows(episodes)
+        
+        self._build_list_surface()
+        self._dirty = True
+    
+    def _build_list_surface(self):
+        """Render every row's text onto one tall surface, scrolled by blitting a window of it"""
+        stride = self._stride
+        height = max(1, len(self.titles) * stride)
+        # Transparent so row highlights drawn underneath show through
+        surface = pygame.Surface((self.rect.width, height), pygame.SRCALPHA).convert_alpha()
+        
+        for i in range(len(self.titles)):
+            y = i * stride
+            surface.blit(self.font.render(self.titles[i], True, Theme.TEXT), (10, y + 5))
+            surface.blit(
+                self.small_font.render(self.metadata[i], True, Theme.TEXT_SECONDARY), (10, y + 32)
+            )
+            if self.descriptions[i]:
+                surface.blit(
+                    self.small_font.render(self.descriptions[i], True, Theme.TEXT_SECONDARY),
+                    (10, y + 52)
+                )
+        self._list_surface = surface
     
     def update(self, mouse_pos: Tuple[int, int]):
         """Update list state"""
-        self.hovered_index = -1
-        for i, rect in enumerate(self.episode_rects):
-            if rect.collidepoint(mouse_pos):
-                self.hovered_index = i
-                break
+        hovered_index = self._index_at(mouse_pos)
+        if hovered_index != self.hovered_index:
+            self.hovered_index = hovered_index
+            self._dirty = True
+    
+    def set_current_index(self, index: int):
+        """Set which row is highlighted as playing (-1 for none)"""
+        if index != self.current_index:
+            self.current_index = index
+            self._dirty = True
+    
+    def _row_rect(self, index: int) -> pygame.Rect:
+        """Get the on-screen rect of an episode row"""
+        actual_y = self.rect.y + self.scroll_offset + index * self._stride
+        return pygame.Rect(self.rect.x, actual_y, self.rect.width, self.episode_height)
     
-    def draw(self, screen: pygame.Surface, episodes: List[Episode], current_episode: Optional[Episode]):
+    def _index_at(self, pos: Tuple[int, int]) -> int:
+        """Get the episode index under a point, or -1 if none"""
+        if not self.rect.collidepoint(pos):
+            return -1
+        # Rows sit on a uniform grid, so the hit row follows from the y offset
+        i, row_y = divmod(pos[1] - self.rect.y - self.scroll_offset, self._stride)
+        if row_y >= self.episode_height or not 0 <= i < len(self.titles):
+            return -1
+        return i
+    
+    def draw(self, screen: pygame.Surface):
         """Draw the episode list"""
+        self._dirty = False
+        current_index = self.current_index
+        
         # Create a clipping region for the list area
         screen.set_clip(self.rect)
         
-        self.episode_rects.clear()
-        y_offset = self.rect.y
+        # Draw backgrounds for the hovered and playing rows only; clipping
+        # takes care of rows scrolled out of view
+        if self.hovered_index >= 0 and self.hovered_index != current_index:
+            pygame.draw.rect(screen, Theme.PANEL_BG, self._row_rect(self.hovered_index))
+        if 0 <= current_index < len(self.titles):
+            ep_rect = self._row_rect(current_index)
+            pygame.draw.rect(screen, Theme.HIGHLIGHT, ep_rect)
+            pygame.draw.rect(screen, Theme.BUTTON, ep_rect, 2)
         
-        for i, episode in enumerate(episodes):
-            # Calculate actual y position
-            actual_y = y_offset + self.scroll_offset
-            
-            # Check if episode is visible
-            if actual_y + self.episode_height < self.rect.y:
-                y_offset += self.episode_height + 10  # Increased spacing between episodes
-                continue
-            if actual_y > self.rect.bottom:
-                break
-            
-            # Create episode rect
-            ep_rect = pygame.Rect(
-                self.rect.x, 
-                actual_y, 
-                self.rect.width, 
-                self.episode_height
-            )
-            self.episode_rects.append(ep_rect)
-            
-            # Draw background
-            if current_episode and episode == current_episode:
-                pygame.draw.rect(screen, Theme.HIGHLIGHT, ep_rect)
-                pygame.draw.rect(screen, Theme.BUTTON, ep_rect, 2)
-            elif i == self.hovered_index:
-                pygame.draw.rect(screen, Theme.PANEL_BG, ep_rect)
-            
-            # Draw title
-            title = episode.title
-            if len(title) > 90:
-                title = title[:87] + '...'
-            title_text = self.font.render(f"{i+1}. {title}", True, Theme.TEXT)
-            screen.blit(title_text, (ep_rect.x + 10, ep_rect.y + 5))
-            
-            # Draw metadata with better vertical spacing
-            metadata_parts = [episode.formatted_date]
-            if episode.formatted_duration:
-                metadata_parts.append(f"Duration: {episode.formatted_duration}")
-            if episode.size_mb:
-                metadata_parts.append(f"Size: {episode.size_mb:.1f} MB")
-            
-            metadata_text = " | ".join(metadata_parts)
-            meta_surface = self.small_font.render(metadata_text, True, Theme.TEXT_SECONDARY)
-            screen.blit(meta_surface, (ep_rect.x + 10, ep_rect.y + 32))
-            
-            # Draw description preview with adjusted position
-            if episode.description:
-                desc = episode.description[:120] + '...' if len(episode.description) > 120 else episode.description
-                desc_surface = self.small_font.render(desc, True, Theme.TEXT_SECONDARY)
-                screen.blit(desc_surface, (ep_rect.x + 10, ep_rect.y + 52))
-            
-            y_offset += self.episode_height + 10  # Increased spacing between episodes
+        # Row text for the whole list is pre-rendered; blit the visible window
+        if self._list_surface:
+            view = pygame.Rect(0, -self.scroll_offset, self.rect.width, self.rect.height)
+            screen.blit(self._list_surface, self.rect.topleft, view)
         
         # Remove clipping
         screen.set_clip(None)
     
-    def scroll(self, delta: int, episode_count: int):
-        """Handle scrolling"""
-        max_scroll = -max(0, episode_count * (self.episode_height + 10) - self.rect.height)
-        self.scroll_offset = max(min(self.scroll_offset + delta, 0), max_scroll)
+    def scroll(self, delta: int):
+        """Queue a scroll; applied once per frame by flush_scroll"""
+        self._pending_delta += delta
+    
+    def flush_scroll(self, episode_count: int):
+        """Apply the scrolling queued since the last frame"""
+        if not self._pending_delta:
+            return
+        delta, self._pending_delta = self._pending_delta, 0
+        max_scroll = -max(0, episode_count * self._stride - self.rect.height)
+        scroll_offset = max(min(self.scroll_offset + delta, 0), max_scroll)
+        if scroll_offset != self.scroll_offset:
+            self.scroll_offset = scroll_offset
+            self._dirty = True
     
     def get_clicked_episode_index(self, pos: Tuple[int, int]) -> int:
         """Get the index of clicked episode, or -1 if none"""
-        for i, rect in enumerate(self.episode_rects):
-            if rect.collidepoint(pos):
-                return i
-        return -1
+        return self._index_at(pos)
 
 class EpisodeDetailsDialog:
     """Modal dialog for episode details"""
@@ -177,11 +290,17 @@ class EpisodeDetailsDialog:
         self.screen_width, self.screen_height = screen_size
         self.fonts = fonts
         self.episode: Optional[Episode] = None
+        self._metadata_lines: List[str] = []
+        self._dirty = False  # Needs repainting
         self.panel_width = 1000
         self.panel_height = 600
         self.panel_x = (self.screen_width - self.panel_width) // 2
         self.panel_y = (self.screen_height - self.panel_height) // 2
         
+        # Static translucent backdrop, built once in the display's pixel format
+        self._overlay = pygame.Surface(screen_size, pygame.SRCALPHA).convert_alpha()
+        self._overlay.fill((20, 20, 30, 240))
+        
         # Create buttons
         self.close_button = Button(
             pygame.Rect(self.panel_x + self.panel_width - 40, self.panel_y + 10, 30, 30),
@@ -196,27 +315,35 @@ class EpisodeDetailsDialog:
     def show(self, episode: Episode):
         """Show dialog for an episode"""
         self.episode = episode
+        self._dirty = True
+        # Built once per show so the per-frame render cache keys stay stable
+        self._metadata_lines = [f"Published: {episode.formatted_date}"]
+        if episode.formatted_duration:
+            self._metadata_lines.append(f"Duration: {episode.formatted_duration}")
+        if episode.size_mb:
+            self._metadata_lines.append(f"File size: {episode.size_mb:.1f} MB")
     
     def hide(self):
         """Hide the dialog"""
         self.episode = None
+        self._dirty = True
     
     def update(self, mouse_pos: Tuple[int, int]):
         """Update dialog components"""
         if self.episode:
             self.close_button.update(mouse_pos)
             self.play_button.update(mouse_pos)
+            if self.close_button._dirty or self.play_button._dirty:
+                self._dirty = True
     
     def draw(self, screen: pygame.Surface):
         """Draw the dialog"""
+        self._dirty = False
         if not self.episode:
             return
         
         # Draw overlay
-        overlay = pygame.Surface((self.screen_width, self.screen_height))
-        overlay.set_alpha(240)
-        overlay.fill((20, 20, 30))
-        screen.blit(overlay, (0, 0))
+        screen.blit(self._overlay, (0, 0))
         
         # Draw panel
         panel_rect = pygame.Rect(self.panel_x, self.panel_y, self.panel_width, self.panel_height)
@@ -236,17 +363,10 @@ class EpisodeDetailsDialog:
         
         # Draw metadata
         y_pos = self.panel_y + 110
-        metadata = [
-            f"Published: {self.episode.formatted_date}",
-            f"Duration: {self.episode.formatted_duration}" if self.episode.formatted_duration else None,
-            f"File size: {self.episode.size_mb:.1f} MB" if self.episode.size_mb else None
-        ]
-        
-        for item in metadata:
-            if item:
-                text_surf = self.fonts['normal'].render(item, True, Theme.TEXT_SECONDARY)
-                screen.blit(text_surf, (self.panel_x + 30, y_pos))
-                y_pos += 25
+        for item in self._metadata_lines:
+            text_surf = cached_render(self.fonts['normal'], item, Theme.TEXT_SECONDARY)
+            screen.blit(text_surf, (self.panel_x + 30, y_pos))
+            y_pos += 25
         
         # Draw description
         y_pos += 20
@@ -264,26 +384,12 @@ class EpisodeDetailsDialog:
     
     def _draw_wrapped_text(self, screen, text, x, y, max_width, font, color, max_lines=None):
         """Helper to draw wrapped text"""
-        words = text.split()
-        lines = []
-        current_line = ""
-        
-        for word in words:
-            test_line = current_line + " " + word if current_line else word
-            if font.size(test_line)[0] < max_width:
-                current_line = test_line
-            else:
-                if current_line:
-                    lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-        
+        lines = wrap_text(text, font, max_width)
         lines_to_draw = lines[:max_lines] if max_lines else lines
         line_height = font.get_height() + 2
         
         for i, line in enumerate(lines_to_draw):
-            text_surf = font.render(line, True, color)
+            text_surf = cached_render(font, line, color)
             screen.blit(text_surf, (x, y + i * line_height))
         
         return y + len(lines_to_draw) * line_height